@@ -1,6 +1,8 @@
 import streamlit as st
 import time
 import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from typing import List
 
@@ -8,6 +10,8 @@ from typing import List
 from provider.open_router import OpenRouter
 from provider.model import Model
 from orchestrator import Orchestrator
+from sink.null import NullSink
+from registry.model_registry import ModelRegistry
 from constants.constants import Model as ModelEnum
 
 # Load environment variables
@@ -53,20 +57,211 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+DEFAULT_MEMBERS = [
+    ModelEnum.OPEN_ROUTER_GPT_OSS_20B.value,
+    ModelEnum.OPEN_ROUTER_GROK_4_1_FAST.value,
+    ModelEnum.OPEN_ROUTER_DEEPSEEK_R1T2_CHIMERA.value
+]
+DEFAULT_HEAD = ModelEnum.OPEN_ROUTER_GROK_4_1_FAST.value
+
+# Discussions running at once across all sessions; further runs queue up
+MAX_CONCURRENT_DISCUSSIONS = int(os.getenv("AI_COUNCIL_MAX_CONCURRENT_DISCUSSIONS", "8"))
+# Seconds between polls of a running discussion's event queue
+POLL_INTERVAL = 1.0
+
+@st.cache_resource
+def get_registry() -> ModelRegistry:
+    # Shared by all sessions so every run contributes to the measured stats
+    return ModelRegistry()
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    # Shared by all sessions so discussions never block a script run
+    return ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DISCUSSIONS, thread_name_prefix="council")
+
+@st.cache_resource
+def get_model(model_name: str) -> Model:
+    return Model(model_name, OpenRouter)
+
+class DiscussionJob:
+    """A discussion running on the shared executor, polled by the session that started it.
+
+    The worker thread only puts events on `events`; all Streamlit calls happen
+    in the session's own script thread when it drains the queue.
+    """
+
+    def __init__(self):
+        self.events: queue.Queue = queue.Queue()
+        self.messages = []
+        self.future = None
+        self.finished = False
+
+    @property
+    def running(self) -> bool:
+        return not self.finished
+
+    def finish(self):
+        """Collect the last events and any error once the discussion is done."""
+        if self.finished or not self.future.done():
+            return
+        self.drain()
+        error = self.future.exception()
+        if error:
+            self.messages.append({"type": "error", "content": str(error)})
+        self.finished = True
+
+    def drain(self) -> list:
+        """Move queued events into `messages` and return only the new messages."""
+        new_messages = []
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            message = event_to_message(event)
+            if message:
+                new_messages.append(message)
+        self.messages.extend(new_messages)
+        return new_messages
+
 def initialize_session_state():
     if "messages" not in st.session_state:
         st.session_state.messages = []
-    if "is_running" not in st.session_state:
-        st.session_state.is_running = False
+    if "job" not in st.session_state:
+        st.session_state.job = None
+    if "selected_models" not in st.session_state:
+        st.session_state.selected_models = DEFAULT_MEMBERS
+    if "head_model" not in st.session_state:
+        st.session_state.head_model = DEFAULT_HEAD
+
+def suggest_council(max_round_p95: float, max_cost: float, num_rounds: int):
+    size = len(st.session_state.selected_models) or len(DEFAULT_MEMBERS)
+    registry = get_registry()
+    # The app runs every model through OpenRouter, so only suggest those
+    candidates = [name for name, profile in registry.profiles.items() if profile.provider == "open_router"]
+    try:
+        members, head = registry.select_council(
+            size,
+            max_round_p95=max_round_p95 or None,
+            max_cost=max_cost or None,
+            num_rounds=num_rounds,
+            candidates=candidates
+        )
+    except ValueError as e:
+        st.session_state.suggest_error = str(e)
+        return
+    st.session_state.suggest_error = None
+    st.session_state.selected_models = members
+    st.session_state.head_model = head
+
+def format_seconds(value) -> str:
+    return "n/a" if value is None else f"{value:.1f}s"
+
+def show_estimates(selected_models: List[str], head_model: str, num_rounds: int, max_round_p95: float, max_cost: float):
+    if not selected_models:
+        return
+    estimate = get_registry().estimate(selected_models, head_model, num_rounds)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("p95 round", format_seconds(estimate["p95_round_latency"]))
+    col2.metric("p95 total", format_seconds(estimate["p95_total_latency"]))
+    col3.metric("Est. cost", f"${estimate['cost']:.4f}")
+
+    if max_round_p95 and estimate["p95_round_latency"] and estimate["p95_round_latency"] > max_round_p95:
+        st.warning(f"Estimated p95 round latency exceeds {max_round_p95:.0f}s")
+    if max_cost and estimate["cost"] > max_cost:
+        st.warning(f"Estimated cost exceeds ${max_cost:.4f}")
+    if estimate["unmeasured"]:
+        st.caption(
+            "No measurements yet for: "
+            + ", ".join(name.split("/")[-1] for name in estimate["unmeasured"])
+        )
 
 def get_council_members(models_selection: List[str]):
     members = []
     names = []
     for model_name in models_selection:
-        members.append(Model(model_name, OpenRouter))
+        members.append(get_model(model_name))
         names.append(model_name.split("/")[-1]) # Simplified name
     return members, names
 
+def event_to_message(event: dict):
+    """Convert an orchestrator progress event into a stored chat message, if it has one."""
+    if event["type"] == "round_start":
+        return {"type": "round_start", "round_number": event["round_number"]}
+    if event["type"] == "member_response":
+        return {
+            "type": "member_response",
+            "name": event["name"],
+            "content": event.get("content", ""),
+            "error": event.get("error")
+        }
+    if event["type"] == "head_decision_complete":
+        return {"type": "head_decision", "content": event["content"]}
+    return None
+
+def render_message(msg: dict):
+    if msg["type"] == "user":
+        with st.chat_message("user"):
+            st.write(msg["content"])
+    
+    elif msg["type"] == "round_start":
+        st.markdown(f"### 🔄 Round {msg['round_number']}")
+        st.divider()
+        
+    elif msg["type"] == "member_response":
+        # Using expander as requested
+        with st.expander(f"{msg['name']} Response", expanded=True):
+            if msg.get("error"):
+                st.error(f"Error: {msg['error']}")
+            else:
+                st.markdown(msg["content"])
+            
+    elif msg["type"] == "head_decision":
+        st.markdown("---")
+        with st.container():
+            st.markdown("### 🎯 Council Head Final Decision")
+            st.info(msg["content"])
+    
+    elif msg["type"] == "error":
+        st.error(f"An error occurred: {msg['content']}")
+
+def start_discussion(query: str, head_model: str, selected_models: List[str], num_rounds: int) -> DiscussionJob:
+    members, names = get_council_members(selected_models)
+    orchestrator = Orchestrator(
+        council_head=get_model(head_model),
+        council_members=members,
+        num_rounds=num_rounds,
+        member_names=names,
+        sink=NullSink(),  # The UI renders via on_progress; keep stdout quiet
+        registry=get_registry()
+    )
+    job = DiscussionJob()
+    job.future = get_executor().submit(orchestrator.run_discussion, query, job.events.put)
+    return job
+
+@st.fragment(run_every=POLL_INTERVAL)
+def live_discussion():
+    """
+    Render the current discussion. Streamlit reruns only this fragment on each
+    poll, so the message history above is not re-rendered while the council
+    deliberates; a poll costs at most the length of the current discussion.
+
+    The finished discussion stays in the fragment until the next full rerun
+    (e.g. the next query), which moves it into the history.
+    """
+    job = st.session_state.job
+    if job is None:
+        return
+    
+    job.drain()
+    job.finish()
+    for msg in job.messages:
+        render_message(msg)
+    
+    if job.running:
+        st.caption("⏳ Council is deliberating...")
+
 def main():
     initialize_session_state()
     
@@ -83,119 +278,68 @@ def main():
         selected_models = st.multiselect(
             "Select Council Members",
             options=available_models,
-            default=[
-                ModelEnum.OPEN_ROUTER_GPT_OSS_20B.value,
-                ModelEnum.OPEN_ROUTER_GROK_4_1_FAST.value,
-                ModelEnum.OPEN_ROUTER_DEEPSEEK_R1T2_CHIMERA.value
-            ],
+            key="selected_models",
             format_func=lambda x: x.split("/")[-1]
         )
         
         head_model = st.selectbox(
             "Select Council Head",
             options=available_models,
-            index=5,
+            key="head_model",
             format_func=lambda x: x.split("/")[-1]
         )
         
         num_rounds = st.slider("Max Discussion Rounds", 1, 3, 3)
         
+        with st.expander("Performance Constraints"):
+            max_round_p95 = st.number_input("Max p95 round latency (s, 0 = no limit)", min_value=0.0, value=20.0, step=5.0)
+            max_cost = st.number_input("Max cost per run ($, 0 = no limit)", min_value=0.0, value=0.01, step=0.005, format="%.4f")
+            st.button(
+                "Suggest council",
+                on_click=suggest_council,
+                args=(max_round_p95, max_cost, num_rounds)
+            )
+            if st.session_state.get("suggest_error"):
+                st.error(st.session_state.suggest_error)
+        
+        show_estimates(selected_models, head_model, num_rounds, max_round_p95, max_cost)
+        
         if not os.getenv("OPENROUTER_API_KEY"):
             st.error("⚠️ OPENROUTER_API_KEY not found in environment variables!")
 
-    # Main Chat Interface
-    query = st.chat_input("Enter your discussion topic...", disabled=st.session_state.is_running)
+    # Main Chat Interface. The input stays enabled: disabling it would need a
+    # full rerun when the discussion ends, re-rendering the whole history.
+    query = st.chat_input("Enter your discussion topic...")
     
-    # Display message history
+    # A finished discussion moves from the live fragment into the history
+    job = st.session_state.job
+    if job is not None:
+        job.finish()
+        if not job.running:
+            st.session_state.messages.extend(job.messages)
+            st.session_state.job = None
+    
+    # Display message history; the running discussion is rendered by the fragment below
     for msg in st.session_state.messages:
-        if msg["type"] == "user":
-            with st.chat_message("user"):
-                st.write(msg["content"])
-        
-        elif msg["type"] == "round_start":
-            st.markdown(f"### 🔄 Round {msg['round_number']}")
-            st.divider()
-            
-        elif msg["type"] == "member_response":
-            # Using expander as requested
-            with st.expander(f"{msg['name']} Response", expanded=True):
-                if msg.get("error"):
-                    st.error(f"Error: {msg['error']}")
-                else:
-                    st.markdown(msg["content"])
-                
-        elif msg["type"] == "head_decision":
-            st.markdown("---")
-            with st.container():
-                st.markdown("### 🎯 Council Head Final Decision")
-                st.info(msg["content"])
-
-    if query and not st.session_state.is_running:
-        st.session_state.is_running = True
-        
-        # Add user message
-        st.session_state.messages.append({"type": "user", "content": query})
-        with st.chat_message("user"):
-            st.write(query)
-            
-        # Initialize Backend
-        try:
-            head = Model(head_model, OpenRouter)
-            members, names = get_council_members(selected_models)
-            
-            orchestrator = Orchestrator(
-                council_head=head,
-                council_members=members,
-                num_rounds=num_rounds,
-                member_names=names
-            )
-            
-            # Progress Callback
-            def on_progress(event):
-                if event["type"] == "round_start":
-                    st.session_state.messages.append({
-                        "type": "round_start", 
-                        "round_number": event["round_number"]
-                    })
-                    st.markdown(f"### 🔄 Round {event['round_number']}")
-                    st.divider()
-                    
-                elif event["type"] == "member_response":
-                    content = event.get("content", "")
-                    error = event.get("error")
-                    
-                    st.session_state.messages.append({
-                        "type": "member_response",
-                        "name": event["name"],
-                        "content": content,
-                        "error": error
-                    })
-                    
-                    with st.expander(f"{event['name']} Response", expanded=True):
-                        if error:
-                            st.error(f"Error: {error}")
-                        else:
-                            st.markdown(content)
-                        
-                elif event["type"] == "head_decision_complete":
-                    st.session_state.messages.append({
-                        "type": "head_decision",
-                        "content": event["content"]
-                    })
-                    st.markdown("---")
-                    with st.container():
-                        st.markdown("### 🎯 Council Head Final Decision")
-                        st.info(event["content"])
+        render_message(msg)
+
+    if query:
+        if st.session_state.job is not None:
+            st.warning("The council is still deliberating. Please wait for the final decision.")
+        else:
+            # Add user message
+            st.session_state.messages.append({"type": "user", "content": query})
+            render_message(st.session_state.messages[-1])
             
-            # Run Discussion
-            with st.spinner("Council is deliberating..."):
-                orchestrator.run_discussion(query, on_progress=on_progress)
-                
-        except Exception as e:
-            st.error(f"An error occurred: {str(e)}")
-        finally:
-            st.session_state.is_running = False
-            st.rerun()
+            # Initialize Backend and run the discussion in the background
+            try:
+                st.session_state.job = start_discussion(query, head_model, selected_models, num_rounds)
+            except Exception as e:
+                st.session_state.messages.append({"type": "error", "content": str(e)})
+                render_message(st.session_state.messages[-1])
+
+    if st.session_state.job is not None:
+        live_discussion()
 
 if __name__ == "__main__":
     main()
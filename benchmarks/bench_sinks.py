@@ -0,0 +1,99 @@
+# ./benchmarks/bench_sinks.py
+"""
+Compare orchestrator throughput across output sinks.
+
+Runs many discussions concurrently against an in-process fake model so that
+the measurement isolates orchestration and transcript output from network I/O.
+
+Usage:
+    python -m benchmarks.bench_sinks [--discussions 50] [--members 3] [--rounds 3]
+
+Console output goes to stdout; redirect it (e.g. `> /dev/null`) or to a terminal
+to compare. The summary table is written to stderr.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orchestrator import Orchestrator
+from sink.console import ConsoleSink
+from sink.null import NullSink
+from sink.file import AsyncFileSink, JsonlSink
+
+
+class FakeModel:
+    """Stand-in for provider.model.Model that returns a canned transcript-sized reply."""
+
+    def __init__(self, name: str, response_chars: int, latency: float):
+        self.name = name
+        self.latency = latency
+        self.reply = {
+            "choices": [{"message": {"content": ("**Key Arguments:** lorem ipsum " * (response_chars // 30 + 1))[:response_chars]}}]
+        }
+
+    def generate(self, messages):
+        if self.latency:
+            time.sleep(self.latency)
+        return self.reply
+
+
+def run(sink_factory, args) -> float:
+    sink = sink_factory()
+
+    def one(i):
+        members = [FakeModel(f"m{j}", args.response_chars, args.latency) for j in range(args.members)]
+        orchestrator = Orchestrator(
+            council_head=FakeModel("head", args.response_chars, args.latency),
+            council_members=members,
+            num_rounds=args.rounds,
+            sink=sink,
+        )
+        orchestrator.run_discussion(f"Discussion {i}")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.discussions) as executor:
+        list(executor.map(one, range(args.discussions)))
+    sink.close()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--discussions", type=int, default=50)
+    parser.add_argument("--members", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--response-chars", type=int, default=4000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated seconds per model call")
+    args = parser.parse_args()
+
+    # Orchestrator logging would dominate the measurement otherwise
+    logging.getLogger("discussion").setLevel(logging.WARNING)
+
+    tmpdir = tempfile.mkdtemp(prefix="ai-council-bench-")
+    sinks = [
+        ("console", ConsoleSink),
+        ("null", NullSink),
+        ("async-file", lambda: AsyncFileSink(os.path.join(tmpdir, "transcript.txt"))),
+        ("jsonl", lambda: JsonlSink(os.path.join(tmpdir, "events.jsonl"))),
+    ]
+
+    results = [(name, run(factory, args)) for name, factory in sinks]
+
+    print(
+        f"\n{args.discussions} concurrent discussions x {args.members} members x {args.rounds} rounds",
+        file=sys.stderr,
+    )
+    print(f"{'sink':<12}{'seconds':>10}{'discussions/s':>16}", file=sys.stderr)
+    for name, elapsed in results:
+        print(f"{name:<12}{elapsed:>10.3f}{args.discussions / elapsed:>16.1f}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,4 +9,31 @@ class Model(Enum):
     OPEN_ROUTER_GEMMA_3_27B_IT = "google/gemma-3-27b-it:free"
     OPEN_ROUTER_GPT_OSS_20B = "openai/gpt-oss-20b:free"
     OPEN_ROUTER_GROK_4_1_FAST = "x-ai/grok-4.1-fast"
-    OPEN_ROUTER_DEEPSEEK_R1T2_CHIMERA = "tngtech/deepseek-r1t2-chimera:free"
\ No newline at end of file
+    OPEN_ROUTER_DEEPSEEK_R1T2_CHIMERA = "tngtech/deepseek-r1t2-chimera:free"
+
+# Static model metadata: provider, context window (tokens) and price in USD per
+# 1M prompt/completion tokens. Prices are approximate list prices; ":free" and
+# Ollama cloud models are billed at zero.
+MODEL_INFO = {
+    Model.OLLAMA_GPT_OSS_120B_CLOUD: {
+        "provider": "ollama", "context_window": 131072, "prompt_price": 0.0, "completion_price": 0.0,
+    },
+    Model.OLLAMA_DEEPSEEK_V3_1_671B_CLOUD: {
+        "provider": "ollama", "context_window": 131072, "prompt_price": 0.0, "completion_price": 0.0,
+    },
+    Model.OLLAMA_QWEN_3_480B_CLOUD: {
+        "provider": "ollama", "context_window": 262144, "prompt_price": 0.0, "completion_price": 0.0,
+    },
+    Model.OPEN_ROUTER_GEMMA_3_27B_IT: {
+        "provider": "open_router", "context_window": 131072, "prompt_price": 0.0, "completion_price": 0.0,
+    },
+    Model.OPEN_ROUTER_GPT_OSS_20B: {
+        "provider": "open_router", "context_window": 131072, "prompt_price": 0.0, "completion_price": 0.0,
+    },
+    Model.OPEN_ROUTER_GROK_4_1_FAST: {
+        "provider": "open_router", "context_window": 2000000, "prompt_price": 0.20, "completion_price": 0.50,
+    },
+    Model.OPEN_ROUTER_DEEPSEEK_R1T2_CHIMERA: {
+        "provider": "open_router", "context_window": 163840, "prompt_price": 0.0, "completion_price": 0.0,
+    },
+}
@@ -0,0 +1,248 @@
+# ./hierarchical_orchestrator.py
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence
+from provider.model import Model
+from orchestrator import Orchestrator
+from prompts.prompts import (
+    SUB_COUNCIL_HEAD_PROMPT,
+    SUB_COUNCIL_HEAD_INSTRUCTION,
+    SUB_COUNCIL_DELEGATE_PROMPT
+)
+from sink.base import BaseSink
+from sink.console import ConsoleSink
+from registry.model_registry import ModelRegistry
+from utils.logger import setup_logger
+
+logger = setup_logger("discussion")
+
+
+class SubCouncilDelegate:
+    """Wraps a sub-council head so that it argues for its group's report at the next level."""
+
+    def __init__(self, model: Model, council_name: str, report: str):
+        self.model = model
+        self.name = getattr(model, "name", council_name)
+        self.council_name = council_name
+        self.report = report
+
+    @property
+    def supports_json_output(self) -> bool:
+        return getattr(self.model, "supports_json_output", False)
+
+    def generate(self, messages: list[dict[str, str]], json_output: bool = False):
+        preamble = SUB_COUNCIL_DELEGATE_PROMPT.format(
+            council_name=self.council_name,
+            report=self.report
+        )
+        messages = [dict(m) for m in messages]
+        if messages and messages[0]["role"] == "system":
+            messages[0]["content"] = preamble + messages[0]["content"]
+        else:
+            messages.insert(0, {"role": "system", "content": preamble})
+
+        if json_output:
+            return self.model.generate(messages, json_output=True)
+        return self.model.generate(messages)
+
+
+def _unwrap(model):
+    """Return the underlying model of a delegate, so reports never stack across levels."""
+    return model.model if isinstance(model, SubCouncilDelegate) else model
+
+
+class HierarchicalOrchestrator:
+    """
+    Runs a discussion as a tree of sub-councils instead of one flat round.
+
+    Members are split into sub-councils of at most `group_size` (one group
+    may take a leftover member and have `group_size + 1`). Each
+    sub-council debates on its own and its local head condenses the debate
+    into a short report. The local heads then debate as delegates at the next
+    level, grouped again if there are still more than `group_size` of them,
+    until a single top-level council remains and the council head decides.
+
+    Every call sees at most `group_size` peers, so prompt size per call stays
+    bounded and the number of levels grows as log(N) in the number of members.
+    Sub-councils on the same level run in parallel.
+    """
+
+    def __init__(
+        self,
+        council_head: Model,
+        council_members: List[Model],
+        group_size: int = 4,
+        num_rounds: int = 3,
+        member_names: List[str] = None,
+        sink: BaseSink = None,
+        structured_output: bool = False,
+        history_sections: Sequence[str] = None,
+        sub_council_head: Model = None,
+        registry: ModelRegistry = None,
+        dedupe_quotes: bool = False
+    ):
+        """
+        Args:
+            council_head: Model that makes final decision at the top level
+            council_members: List of models that participate in discussion
+            group_size: Target maximum members per sub-council (at least 2)
+            num_rounds: Desired number of discussion rounds at every level
+            member_names: Optional names for members (default: Member 1, Member 2, ...)
+            sink: Where the transcript is written (default: ConsoleSink), shared by all levels
+            structured_output: See Orchestrator
+            history_sections: See Orchestrator
+            sub_council_head: Model that condenses each sub-council's debate
+                (default: the first member of each sub-council)
+            registry: See Orchestrator
+            dedupe_quotes: See Orchestrator
+        """
+        if group_size < 2:
+            raise ValueError("group_size must be at least 2")
+
+        self.council_head = council_head
+        self.council_members = council_members
+        self.group_size = group_size
+        self.num_rounds = num_rounds
+        self.member_names = member_names or [f"Member {i+1}" for i in range(len(council_members))]
+        self.sink = sink if sink is not None else ConsoleSink()
+        self.structured_output = structured_output
+        self.history_sections = history_sections
+        self.sub_council_head = sub_council_head
+        self.registry = registry
+        self.dedupe_quotes = dedupe_quotes
+
+        logger.info(
+            f"Initialized hierarchical orchestrator with "
+            f"{len(council_members)} members, group_size={group_size}"
+        )
+
+    def _split(self, count: int) -> List[range]:
+        """
+        Split `count` items into the fewest contiguous groups of near-equal size.
+
+        A leftover single item (e.g. 9 items with group_size=2) is folded into
+        the preceding group, which then has group_size + 1 items, so no group
+        ever has just one participant.
+        """
+        num_groups = math.ceil(count / self.group_size)
+        size, extra = divmod(count, num_groups)
+        groups = []
+        start = 0
+        for i in range(num_groups):
+            end = start + size + (1 if i < extra else 0)
+            if end - start == 1 and groups:
+                groups[-1] = range(groups[-1].start, end)
+            else:
+                groups.append(range(start, end))
+            start = end
+        return groups
+
+    def _orchestrator(self, head, members, names, **kwargs) -> Orchestrator:
+        return Orchestrator(
+            council_head=head,
+            council_members=members,
+            num_rounds=self.num_rounds,
+            member_names=names,
+            sink=self.sink,
+            structured_output=self.structured_output,
+            history_sections=self.history_sections,
+            registry=self.registry,
+            dedupe_quotes=self.dedupe_quotes,
+            **kwargs
+        )
+
+    def _run_sub_council(
+        self,
+        council_name: str,
+        members: list,
+        names: List[str],
+        query: str,
+        on_progress: callable = None
+    ) -> tuple:
+        """Run one sub-council and return (delegate or None, result)."""
+        # From level 2 on members are delegates; the head condenses as itself,
+        # not as the delegate of a lower sub-council
+        head = _unwrap(self.sub_council_head or members[0])
+        orchestrator = self._orchestrator(
+            head,
+            members,
+            names,
+            council_name=council_name,
+            head_prompt=SUB_COUNCIL_HEAD_PROMPT,
+            head_instruction=SUB_COUNCIL_HEAD_INSTRUCTION
+        )
+        result = orchestrator.run_discussion(query, on_progress)
+        result["council"] = council_name
+
+        report = result["final_decision"]
+        if not report or report.startswith("⚠️"):
+            logger.warning(f"{council_name} produced no report; dropping it from the next level")
+            return None, result
+        return SubCouncilDelegate(head, council_name, report), result
+
+    def run_discussion(self, query: str, on_progress: callable = None) -> dict:
+        """
+        Run the hierarchical discussion and final decision.
+
+        Args:
+            query: The topic or question for discussion
+            on_progress: Optional callback function(event_dict) for real-time updates.
+                Sub-council events carry a "council" key and may arrive from
+                worker threads.
+
+        Returns:
+            The top-level Orchestrator result, plus:
+                'sub_councils' (one list of sub-council results per level)
+                'num_levels'
+        """
+        logger.info(f"Starting hierarchical discussion: {query[:100]}...")
+
+        members = list(self.council_members)
+        names = list(self.member_names)
+        levels = []
+        level = 1
+
+        # A split into a single group (e.g. group_size + 1 participants) is the top level
+        while len(members) > self.group_size and len(self._split(len(members))) > 1:
+            groups = self._split(len(members))
+            logger.info(f"Level {level}: {len(members)} participants in {len(groups)} sub-councils")
+
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                futures = [
+                    executor.submit(
+                        self._run_sub_council,
+                        f"Sub-council {level}.{i+1}",
+                        [members[j] for j in group],
+                        [names[j] for j in group],
+                        query,
+                        on_progress
+                    )
+                    for i, group in enumerate(groups)
+                ]
+                outcomes = [future.result() for future in futures]
+
+            levels.append([result for _, result in outcomes])
+            members = [delegate for delegate, _ in outcomes if delegate]
+            names = [delegate.council_name for delegate in members]
+            level += 1
+
+        if not members:
+            logger.error("No sub-council produced a report; cannot reach a decision")
+            return {
+                "query": query,
+                "final_decision": None,
+                "discussion_history": [],
+                "num_rounds_requested": min(self.num_rounds, 3),
+                "num_rounds_executed": 0,
+                "stopped_early": False,
+                "sub_councils": levels,
+                "num_levels": len(levels),
+            }
+
+        result = self._orchestrator(self.council_head, members, names).run_discussion(query, on_progress)
+        result["sub_councils"] = levels
+        result["num_levels"] = len(levels) + 1
+
+        logger.info(f"Hierarchical discussion completed over {result['num_levels']} levels")
+        return result
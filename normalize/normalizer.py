@@ -0,0 +1,203 @@
+# ./normalize/normalizer.py
+
+import math
+import re
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# A step takes text and returns (cleaned text, removed reasoning trace or "")
+Step = Callable[[str], Tuple[str, str]]
+
+_REASONING_TAGS = ("think", "thinking", "reasoning")
+_REASONING_BLOCK_RE = re.compile(
+    r"<(%s)>(.*?)</\1>" % "|".join(_REASONING_TAGS),
+    re.DOTALL | re.IGNORECASE,
+)
+# R1-style only: a reply that starts mid-trace, or a trace truncated before its closing tag
+_UNOPENED_CLOSE_RE = re.compile(r"\A(.*?)</think>", re.DOTALL | re.IGNORECASE)
+_UNCLOSED_OPEN_RE = re.compile(r"\A\s*<think>(.*)\Z", re.DOTALL | re.IGNORECASE)
+
+_HARMONY_FINAL = "<|channel|>final<|message|>"
+_HARMONY_TOKEN_RE = re.compile(r"<\|[a-z_]+\|>")
+
+# Only a short filler line standing on its own, e.g. "Sure! Here's my analysis:"
+_OPENING_FILLER_RE = re.compile(
+    r"\A\s*(?:sure|certainly|of course|absolutely|great question)\b[,!.]?[ \t]*"
+    r"(?:here'?s[^\n]{0,60})?[ \t]*\n",
+    re.IGNORECASE,
+)
+# Only a short sign-off line standing on its own, e.g. "Let me know if you need more."
+_CLOSING_FILLER_RE = re.compile(
+    r"\n[ \t]*(?:i[ \t]+)?(?:hope this helps|let me know if|feel free to ask)\b[^\n]{0,60}?[.!]?[ \t]*\s*\Z",
+    re.IGNORECASE,
+)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_TRAILING_SPACE_RE = re.compile(r"[ \t]+$", re.MULTILINE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 UTF-8 bytes per token); good enough for reporting."""
+    return math.ceil(len(text.encode("utf-8")) / 4) if text else 0
+
+
+def strip_reasoning_tags(text: str) -> Tuple[str, str]:
+    """Remove complete <think>/<thinking>/<reasoning> blocks."""
+    traces = []
+
+    def _take(match):
+        traces.append(match.group(2).strip())
+        return ""
+
+    text = _REASONING_BLOCK_RE.sub(_take, text)
+    return text.strip(), "\n\n".join(t for t in traces if t)
+
+
+def strip_r1_reasoning(text: str) -> Tuple[str, str]:
+    """
+    Remove <think> traces as emitted by DeepSeek-R1-style models.
+
+    Besides complete blocks, handles a closing tag without an opening one
+    (some variants start the reply mid-trace) and a reply that opens with
+    <think> but is truncated before the closing tag.
+    """
+    text, trace = strip_reasoning_tags(text)
+    traces = [trace] if trace else []
+
+    match = _UNOPENED_CLOSE_RE.match(text)
+    if match:
+        traces.insert(0, match.group(1).strip())
+        text = text[match.end():]
+
+    match = _UNCLOSED_OPEN_RE.match(text)
+    if match:
+        traces.append(match.group(1).strip())
+        text = ""
+
+    return text.strip(), "\n\n".join(t for t in traces if t)
+
+
+def strip_harmony_channels(text: str) -> Tuple[str, str]:
+    """Keep only the final channel of leaked gpt-oss (harmony) output."""
+    if _HARMONY_FINAL not in text:
+        return _HARMONY_TOKEN_RE.sub("", text), ""
+    reasoning, _, final = text.rpartition(_HARMONY_FINAL)
+    reasoning = _HARMONY_TOKEN_RE.sub(" ", reasoning).strip()
+    return _HARMONY_TOKEN_RE.sub("", final).strip(), reasoning
+
+
+def collapse_boilerplate(text: str) -> Tuple[str, str]:
+    """Drop conversational filler at the edges and collapse redundant whitespace."""
+    text = _OPENING_FILLER_RE.sub("", text)
+    text = _CLOSING_FILLER_RE.sub("", text)
+    text = _TRAILING_SPACE_RE.sub("", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    return text.strip(), ""
+
+
+DEFAULT_STEPS: Tuple[Step, ...] = (strip_reasoning_tags, collapse_boilerplate)
+
+# Model name fragment -> steps; the first matching fragment wins
+MODEL_STEPS: Dict[str, Tuple[Step, ...]] = {
+    "gpt-oss": (strip_harmony_channels, strip_reasoning_tags, collapse_boilerplate),
+    "deepseek-r1": (strip_r1_reasoning, collapse_boilerplate),
+}
+
+
+def steps_for(model_name: str) -> Tuple[Step, ...]:
+    """Return the normalization steps configured for `model_name`."""
+    for fragment, steps in MODEL_STEPS.items():
+        if model_name and fragment in model_name:
+            return steps
+    return DEFAULT_STEPS
+
+
+def dedupe_quotes(text: str, others: Dict[str, Iterable[str]], min_chars: int = 40) -> str:
+    """
+    Replace blockquotes that repeat another member's earlier output.
+
+    Args:
+        text: Response to clean
+        others: Member name -> that member's earlier responses
+        min_chars: Shorter quotes are kept, since they are cheap and add precision
+    """
+    if not others or ">" not in text:
+        return text
+
+    haystacks = {
+        name: _WHITESPACE_RE.sub(" ", " ".join(contents)).lower()
+        for name, contents in others.items()
+    }
+
+    lines = text.split("\n")
+    out: List[str] = []
+    i = 0
+    while i < len(lines):
+        if not lines[i].lstrip().startswith(">"):
+            out.append(lines[i])
+            i += 1
+            continue
+
+        start = i
+        while i < len(lines) and lines[i].lstrip().startswith(">"):
+            i += 1
+        block = lines[start:i]
+        quoted = _WHITESPACE_RE.sub(" ", " ".join(l.lstrip()[1:] for l in block)).strip().strip('"').lower()
+
+        source = None
+        if len(quoted) >= min_chars:
+            source = next((name for name, hay in haystacks.items() if quoted in hay), None)
+        if source:
+            out.append(f"> [quoting {source}]")
+        else:
+            out.extend(block)
+    return "\n".join(out)
+
+
+class NormalizedOutput:
+    """Cleaned response text plus what was removed from it."""
+
+    __slots__ = ("content", "reasoning", "bytes_removed", "tokens_removed")
+
+    def __init__(self, content: str, reasoning: str, bytes_removed: int, tokens_removed: int):
+        self.content = content
+        self.reasoning = reasoning
+        self.bytes_removed = bytes_removed
+        self.tokens_removed = tokens_removed
+
+
+def normalize_output(
+    model_name: str,
+    text: str,
+    reasoning: str = None,
+    others: Dict[str, Sequence[str]] = None
+) -> NormalizedOutput:
+    """
+    Run the model's normalization steps over `text`.
+
+    Args:
+        model_name: Model ID, used to pick the steps
+        text: Raw response content
+        reasoning: Reasoning trace the provider returned in a separate field;
+            kept alongside any trace stripped from the content
+        others: If given, blockquotes repeating these members' earlier
+            responses are replaced (see dedupe_quotes)
+    """
+    content = text or ""
+    traces = [reasoning.strip()] if reasoning and reasoning.strip() else []
+
+    for step in steps_for(model_name):
+        content, trace = step(content)
+        if trace:
+            traces.append(trace)
+
+    if others:
+        content = dedupe_quotes(content, others)
+
+    original = text or ""
+    bytes_removed = len(original.encode("utf-8")) - len(content.encode("utf-8"))
+    return NormalizedOutput(
+        content=content,
+        reasoning="\n\n".join(traces),
+        bytes_removed=max(bytes_removed, 0),
+        tokens_removed=max(estimate_tokens(original) - estimate_tokens(content), 0),
+    )
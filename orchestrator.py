@@ -1,13 +1,22 @@
 # ./discussion_orchestrator.py
 
 from provider.model import Model
-from typing import List, Dict
+from typing import List, Dict, Sequence
 from prompts.prompts import (
     DISCUSSION_ROUND_1_PROMPT,
     DISCUSSION_ROUND_N_PROMPT,
-    COUNCIL_HEAD_DISCUSSION_PROMPT
+    COUNCIL_HEAD_DISCUSSION_PROMPT,
+    STRUCTURED_OUTPUT_PROMPT,
+    STRUCTURED_ROUND_1_FIELDS,
+    STRUCTURED_ROUND_N_FIELDS
 )
+from structured.record import MemberResponse
+from structured.parser import parse_member_response
+from registry.model_registry import ModelRegistry
+from normalize.normalizer import normalize_output
 from utils.logger import setup_logger
+from sink.base import BaseSink
+from sink.console import ConsoleSink
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
@@ -22,7 +31,15 @@ class Orchestrator:
         council_head: Model, 
         council_members: List[Model],
         num_rounds: int = 3,
-        member_names: List[str] = None
+        member_names: List[str] = None,
+        sink: BaseSink = None,
+        structured_output: bool = False,
+        history_sections: Sequence[str] = None,
+        council_name: str = None,
+        head_prompt: str = COUNCIL_HEAD_DISCUSSION_PROMPT,
+        head_instruction: str = None,
+        registry: ModelRegistry = None,
+        dedupe_quotes: bool = False
     ):
         """
         Args:
@@ -30,6 +47,22 @@ class Orchestrator:
             council_members: List of models that participate in discussion
             num_rounds: Desired number of discussion rounds
             member_names: Optional names for members (default: Member 1, Member 2, ...)
+            sink: Where the transcript is written (default: ConsoleSink).
+                Services should pass a NullSink or a file sink.
+            structured_output: Ask members whose provider supports it for JSON output.
+                Responses are parsed into sections either way.
+            history_sections: Section keys (see structured.record.SECTION_TITLES) that
+                members see from earlier rounds, e.g. ("position", "disagreements").
+                None sends full responses. The council head always sees full responses.
+            council_name: Optional name added to every emitted event as "council",
+                used to tell sub-councils apart in a hierarchical discussion.
+            head_prompt: System prompt for the head, formatted with num_rounds,
+                full_discussion and council_name
+            head_instruction: User instruction for the head (default: final decision)
+            registry: Optional ModelRegistry that records latency, token and error
+                stats for every call; saved at the end of each discussion
+            dedupe_quotes: Replace blockquotes that repeat another member's
+                earlier response before the response enters the history
         """
         # Enforce a max of 3 rounds
         self.num_rounds = min(num_rounds, 3)
@@ -38,6 +71,18 @@ class Orchestrator:
         self.council_members = council_members
         self.member_names = member_names or [f"Member {i+1}" for i in range(len(council_members))]
         self.discussion_history: List[Dict] = []
+        self.sink = sink if sink is not None else ConsoleSink()
+        self.structured_output = structured_output
+        self.history_sections = tuple(history_sections) if history_sections else None
+        self.council_name = council_name
+        self.head_prompt = head_prompt
+        self.head_instruction = head_instruction or (
+            "Provide your final decision based on the discussion above. "
+            "If you think more rounds were needed, mention that in your reasoning, "
+            "but still provide the best possible decision now."
+        )
+        self.registry = registry
+        self.dedupe_quotes = dedupe_quotes
         
         logger.info(
             f"Initialized discussion orchestrator with "
@@ -45,6 +90,13 @@ class Orchestrator:
             f"using num_rounds={self.num_rounds} (max 3)"
         )
 
+    def _event(self, event_type: str, **fields) -> dict:
+        """Build an event dict, tagged with the council name if one is set."""
+        event = {"type": event_type, **fields}
+        if self.council_name:
+            event["council"] = self.council_name
+        return event
+
     def _extract_content(self, response: dict) -> str:
         """Extract content from different provider response formats."""
         if not response:
@@ -53,6 +105,16 @@ class Orchestrator:
             return response.get("choices", [{}])[0].get("message", {}).get("content", "")
         return response.get("message", {}).get("content", "")
 
+    def _extract_reasoning(self, response: dict) -> str:
+        """Extract a separately returned reasoning trace (OpenRouter 'reasoning', Ollama 'thinking')."""
+        if not response:
+            return ""
+        if "choices" in response:
+            message = response.get("choices", [{}])[0].get("message", {})
+        else:
+            message = response.get("message", {})
+        return message.get("reasoning") or message.get("reasoning_content") or message.get("thinking") or ""
+
     def _extract_error(self, response: dict) -> str:
         """Extract error message from response if present."""
         if not response:
@@ -64,18 +126,42 @@ class Orchestrator:
             return str(error)
         return None
 
+    def _extract_usage(self, response: dict) -> tuple:
+        """Extract (prompt_tokens, completion_tokens) from a response, if reported."""
+        if not response:
+            return None, None
+        usage = response.get("usage")
+        if usage:
+            return usage.get("prompt_tokens"), usage.get("completion_tokens")
+        # Ollama reports token counts at the top level
+        return response.get("prompt_eval_count"), response.get("eval_count")
+
+    def _record_call(self, model, elapsed: float, response: dict = None, failed: bool = False):
+        """Record call stats in the registry, if one is configured."""
+        if not self.registry:
+            return
+        name = getattr(model, "name", None)
+        if not name:
+            return
+        prompt_tokens, completion_tokens = self._extract_usage(response)
+        self.registry.record(name, elapsed, prompt_tokens, completion_tokens, error=failed)
+
     def _get_member_response(
         self, 
         member: Model, 
         member_name: str,
-        messages: List[dict]
+        messages: List[dict],
+        json_output: bool = False
     ) -> tuple:
         """Get response from a single member with error handling."""
         try:
             logger.info(f"{member_name} starting response...")
             start_time = time.time()
             
-            response = member.generate(messages)
+            if json_output:
+                response = member.generate(messages, json_output=True)
+            else:
+                response = member.generate(messages)
             
             # Debug logging
             import json
@@ -85,6 +171,7 @@ class Orchestrator:
                 logger.debug(f"{member_name} raw response: {response}")
 
             content = self._extract_content(response)
+            reasoning = self._extract_reasoning(response)
             error_msg = None
             
             if not content:
@@ -99,16 +186,26 @@ class Orchestrator:
 
             elapsed = time.time() - start_time
             logger.info(f"{member_name} completed in {elapsed:.2f}s")
+            self._record_call(member, elapsed, response, failed=bool(error_msg))
             
-            return content, error_msg
+            return content, error_msg, reasoning
         except Exception as e:
             error_msg = f"Error: {str(e)}"
             logger.error(f"{member_name} failed: {error_msg}", exc_info=True)
-            return None, error_msg
+            self._record_call(member, time.time() - start_time, failed=True)
+            return None, error_msg, ""
+
 
+    def _earlier_responses(self) -> Dict[str, List[str]]:
+        """Map each member name to its responses from earlier rounds."""
+        earlier: Dict[str, List[str]] = {}
+        for round_data in self.discussion_history:
+            for response in round_data["responses"]:
+                earlier.setdefault(response.name, []).append(response.content)
+        return earlier
 
-    def _format_discussion_history(self, up_to_round: int = None) -> str:
-        """Format discussion history for context."""
+    def _format_discussion_history(self, up_to_round: int = None, sections: Sequence[str] = None) -> str:
+        """Format discussion history for context, optionally limited to some sections."""
         if up_to_round is None:
             up_to_round = len(self.discussion_history)
         
@@ -120,13 +217,11 @@ class Orchestrator:
             formatted += f"{'='*80}\n\n"
             
             for response in round_data["responses"]:
-                name = response["name"]
-                content = response["content"]
-                formatted += f"--- {name} ---\n{content}\n\n"
+                formatted += f"--- {response.name} ---\n{response.render(sections)}\n\n"
         
         return formatted
 
-    def _should_stop_early(self, round_responses: List[Dict]) -> bool:
+    def _should_stop_early(self, round_responses: List[MemberResponse]) -> bool:
         """
         Agents can request early stop by returning a special keyword.
         
@@ -136,14 +231,16 @@ class Orchestrator:
           
           If you believe the discussion should stop immediately,
           include the phrase STOP_DISCUSSION somewhere in your reply.
+        
+        The signals are detected once when each response is parsed (or read from
+        the JSON fields in structured mode), so this check is just a flag scan.
         """
         for r in round_responses:
-            content = r["content"].strip().lower()
-            if "stop_discussion" in content:
-                logger.info(f"{r['name']} requested STOP_DISCUSSION")
+            if r.stop_discussion:
+                logger.info(f"{r.name} requested STOP_DISCUSSION")
                 return True
-            if "ready_for_decision" in content:
-                logger.info(f"{r['name']} requested READY_FOR_DECISION")
+            if r.ready_for_decision:
+                logger.info(f"{r.name} requested READY_FOR_DECISION")
                 return True
         return False
 
@@ -152,20 +249,20 @@ class Orchestrator:
         logger.info(f"Starting Round {round_number}")
         
         if on_progress:
-            on_progress({"type": "round_start", "round_number": round_number})
+            on_progress(self._event("round_start", round_number=round_number))
         
-        print(f"\n{'='*80}")
-        print(f"ROUND {round_number}")
-        print(f"{'='*80}\n")
+        self.sink.emit(self._event("round_start", round_number=round_number))
         
         # Build messages for this round
         if round_number == 1:
             # First round, initial positions
             system_prompt = DISCUSSION_ROUND_1_PROMPT
+            structured_fields = STRUCTURED_ROUND_1_FIELDS
             user_content = f"Query: {query}"
         else:
             # Subsequent rounds debate with history
-            discussion_so_far = self._format_discussion_history(round_number - 1)
+            discussion_so_far = self._format_discussion_history(round_number - 1, self.history_sections)
+            structured_fields = STRUCTURED_ROUND_N_FIELDS
             system_prompt = DISCUSSION_ROUND_N_PROMPT.format(
                 discussion_history=discussion_so_far,
                 round_number=round_number
@@ -182,9 +279,20 @@ class Orchestrator:
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_content},
         ]
+        structured_messages = [
+            {"role": "system", "content": system_prompt + STRUCTURED_OUTPUT_PROMPT.format(fields=structured_fields)},
+            {"role": "user", "content": user_content},
+        ]
+        json_members = [
+            self.structured_output and getattr(member, "supports_json_output", False)
+            for member in self.council_members
+        ]
         
         # Collect responses from all members in parallel
-        round_responses: List[Dict] = []
+        round_responses: List[MemberResponse] = []
+        earlier = self._earlier_responses() if self.dedupe_quotes else {}
+        bytes_removed = 0
+        tokens_removed = 0
         start_time = time.time()
         
         # We need to process results as they come in for the UI
@@ -194,63 +302,96 @@ class Orchestrator:
                     self._get_member_response,
                     member,
                     self.member_names[idx],
-                    messages
+                    structured_messages if json_members[idx] else messages,
+                    json_members[idx]
                 ): (member, self.member_names[idx], idx)
                 for idx, member in enumerate(self.council_members)
             }
             
-            # Since we want ordered results for the history/print but potentially realtime 
+            # Since we want ordered results for the history/sink but potentially realtime 
             # updates for UI, we can emit events as they complete, but store them 
             # and sort later for the history.
             
             results = []
             for future in as_completed(future_to_member):
-                _, name, idx = future_to_member[future]
-                content, error = future.result()
+                member, name, idx = future_to_member[future]
+                content, error, reasoning = future.result()
+                
+                record = None
+                if not error:
+                    # Strip reasoning traces and boilerplate before the response is reused
+                    normalized = normalize_output(
+                        getattr(member, "name", ""),
+                        content,
+                        reasoning,
+                        others={n: c for n, c in earlier.items() if n != name}
+                    )
+                    bytes_removed += normalized.bytes_removed
+                    tokens_removed += normalized.tokens_removed
+                    
+                    if normalized.content:
+                        record = parse_member_response(name, round_number, normalized.content, structured=json_members[idx])
+                        record.reasoning = normalized.reasoning
+                        content = record.content
+                    else:
+                        logger.warning(f"{name} response was only a reasoning trace")
+                        content = None
+                        error = "Response contained only a reasoning trace"
                 
                 # Emit real-time event
                 if on_progress:
-                    on_progress({
-                        "type": "member_response",
-                        "name": name,
-                        "content": content,
-                        "error": error
-                    })
+                    on_progress(self._event(
+                        "member_response",
+                        name=name,
+                        content=content,
+                        error=error
+                    ))
                 
-                results.append((idx, name, content, error))
+                results.append((idx, name, content, error, record))
             
-            # Sort by original index to keep member ordering in standard output/history
+            # Sort by original index to keep member ordering in sink output/history
             results.sort(key=lambda x: x[0])
         
         elapsed = time.time() - start_time
         logger.info(f"Round {round_number} completed in {elapsed:.2f}s")
+        logger.info(
+            f"Round {round_number} normalization removed {bytes_removed} bytes "
+            f"(~{tokens_removed} tokens)"
+        )
         
-        # Display and store responses (for history)
-        for idx, name, content, error in results:
-            print(f"{'─'*80}")
-            print(f"{name}:")
-            print(f"{'─'*80}")
+        # Write and store responses (for history)
+        for idx, name, content, error, record in results:
+            self.sink.emit(self._event(
+                "member_response",
+                round_number=round_number,
+                name=name,
+                content=content,
+                error=error,
+                reasoning=record.reasoning if record else ""
+            ))
             
             if error:
-                print(f"⚠️  {error}")
                 logger.warning(f"{name} failed in round {round_number}")
             else:
-                print(content)
-                round_responses.append(
-                    {
-                        "name": name,
-                        "content": content,
-                    }
-                )
-            print()
+                round_responses.append(record)
         
         # Store round in history
         self.discussion_history.append(
             {
                 "round": round_number,
                 "responses": round_responses,
+                "normalization": {
+                    "bytes_removed": bytes_removed,
+                    "tokens_removed": tokens_removed,
+                },
             }
         )
+        self.sink.emit(self._event(
+            "normalization",
+            round_number=round_number,
+            bytes_removed=bytes_removed,
+            tokens_removed=tokens_removed
+        ))
 
         # Early stop logic based on member signals
         if round_responses and self._should_stop_early(round_responses):
@@ -265,30 +406,24 @@ class Orchestrator:
         logger.info("Council head making final decision...")
         
         if on_progress:
-            on_progress({"type": "head_decision_start"})
+            on_progress(self._event("head_decision_start"))
         
-        print(f"\n{'='*80}")
-        print("🎯 COUNCIL HEAD FINAL DECISION")
-        print(f"{'='*80}\n")
+        self.sink.emit(self._event("head_decision_start"))
         
         full_discussion = self._format_discussion_history()
         
         messages = [
             {
                 "role": "system",
-                "content": COUNCIL_HEAD_DISCUSSION_PROMPT.format(
+                "content": self.head_prompt.format(
                     num_rounds=len(self.discussion_history),
-                    full_discussion=full_discussion
+                    full_discussion=full_discussion,
+                    council_name=self.council_name or "the council"
                 ),
             },
             {
                 "role": "user",
-                "content": (
-                    f"Original Query: {query}\n\n"
-                    f"Provide your final decision based on the discussion above. "
-                    f"If you think more rounds were needed, mention that in your reasoning, "
-                    f"but still provide the best possible decision now."
-                ),
+                "content": f"Original Query: {query}\n\n{self.head_instruction}",
             },
         ]
         
@@ -304,6 +439,12 @@ class Orchestrator:
                 logger.debug(f"Head raw response: {response}")
 
             content = self._extract_content(response)
+            if content:
+                content = normalize_output(
+                    getattr(self.council_head, "name", ""),
+                    content,
+                    self._extract_reasoning(response)
+                ).content
             
             if not content:
                 api_error = self._extract_error(response)
@@ -317,20 +458,18 @@ class Orchestrator:
             elapsed = time.time() - start_time
             
             logger.info(f"Head decision completed in {elapsed:.2f}s")
+            self._record_call(self.council_head, elapsed, response, failed=content.startswith("⚠️"))
             
-            print(content)
-            print(f"\n{'='*80}\n")
+            self.sink.emit(self._event("head_decision_complete", content=content))
             
             if on_progress:
-                on_progress({
-                    "type": "head_decision_complete",
-                    "content": content
-                })
+                on_progress(self._event("head_decision_complete", content=content))
             
             return content
         except Exception as e:
             logger.error(f"Head decision failed: {str(e)}", exc_info=True)
-            print(f"❌ Error: Council head failed to make decision: {str(e)}")
+            self._record_call(self.council_head, time.time() - start_time, failed=True)
+            self.sink.emit(self._event("head_decision_error", error=str(e)))
             return None
 
     def run_discussion(self, query: str, on_progress: callable = None) -> dict:
@@ -353,20 +492,19 @@ class Orchestrator:
             dict with:
                 'query'
                 'final_decision'
-                'discussion_history'
+                'discussion_history' (list of {'round', 'responses': [MemberResponse], 'normalization'})
                 'num_rounds_requested'
                 'num_rounds_executed'
                 'stopped_early'
         """
         logger.info(f"Starting autonomous discussion: {query[:100]}...")
         
-        print("="*80)
-        print(f"QUERY: {query}")
-        print("="*80)
-        print(
-            f"\nStarting discussion with up to {self.num_rounds} rounds "
-            f"and {len(self.council_members)} members...\n"
-        )
+        self.sink.emit(self._event(
+            "discussion_start",
+            query=query,
+            num_rounds=self.num_rounds,
+            num_members=len(self.council_members)
+        ))
         
         self.discussion_history = []
         
@@ -380,7 +518,7 @@ class Orchestrator:
 
             if result == "EARLY_STOP":
                 early_stop = True
-                print(f"\nAgents ended discussion after round {round_num}")
+                self.sink.emit(self._event("discussion_stopped_early", round_number=round_num))
                 break
 
             if not result:
@@ -398,6 +536,12 @@ class Orchestrator:
             "stopped_early": early_stop,
         }
         
+        if self.registry:
+            try:
+                self.registry.save()
+            except OSError as e:
+                logger.warning(f"Could not save model stats: {e}")
+        
         logger.info(
             f"Discussion completed. Executed {rounds_executed} rounds, "
             f"early_stop={early_stop}"
@@ -59,4 +59,51 @@ Provide your FINAL DECISION:
 **Unresolved Issues:** [Any remaining uncertainties or caveats, if applicable]
 
 Your answer should be authoritative and decisive, representing the collective wisdom of the council's debate.
-"""
\ No newline at end of file
+"""
+
+# Appended to the round prompts when structured (JSON) output is enabled
+STRUCTURED_OUTPUT_PROMPT = """
+
+OUTPUT FORMAT OVERRIDE: Respond with a single JSON object and nothing else. Use these keys:
+{fields}
+  "ready_for_decision": true if you believe the council is ready for a final decision, else false
+  "stop_discussion": true if you believe the discussion should stop now, else false
+
+Each text field is a string; use a JSON array of strings for lists of points.
+"""
+
+STRUCTURED_ROUND_1_FIELDS = """  "position": your stance on the topic
+  "key_arguments": your main reasoning and evidence
+  "concerns": any issues or questions you foresee"""
+
+STRUCTURED_ROUND_N_FIELDS = """  "position": your current stance after reviewing others' arguments
+  "agreements": points from others you agree with and why
+  "disagreements": points you challenge and your counterarguments
+  "new_insights": how your thinking has evolved"""
+
+# Hierarchical mode - local head condenses its sub-council's debate for the next level
+SUB_COUNCIL_HEAD_PROMPT = """You are the head of {council_name}, one of several sub-councils discussing the same query. Your sub-council has completed {num_rounds} rounds of discussion.
+
+SUB-COUNCIL DISCUSSION:
+{full_discussion}
+
+Condense this debate into a short report that you will defend against the other sub-councils. Keep only what matters for reaching a decision.
+
+Format your response as:
+**Position:** [The position your sub-council converged on, or the competing positions if it did not]
+**Key Arguments:** [The strongest arguments and evidence raised]
+**Disagreements:** [Unresolved points of contention within the sub-council]
+
+Be concise. Do not repeat the discussion verbatim.
+"""
+
+SUB_COUNCIL_HEAD_INSTRUCTION = "Write the condensed report of your sub-council's discussion."
+
+# Hierarchical mode - prepended to a sub-council head's prompts at the next level
+SUB_COUNCIL_DELEGATE_PROMPT = """You are the delegate of {council_name}. Your sub-council concluded:
+
+{report}
+
+Represent this conclusion in the discussion below. Update it where other delegates present stronger evidence.
+
+"""
@@ -3,9 +3,12 @@
 from abc import ABC, abstractmethod
 
 class BaseProvider(ABC):
+    # Whether the provider can constrain output to a JSON object
+    supports_json_output: bool = False
+
     def __init__(self, model: str):
         self.model = model
     
     @abstractmethod
-    def generate(self, messages: list[dict[str, str]]):
-        raise NotImplementedError
\ No newline at end of file
+    def generate(self, messages: list[dict[str, str]], json_output: bool = False):
+        raise NotImplementedError
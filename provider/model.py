@@ -7,5 +7,11 @@ class Model:
         self.name = name
         self.provider = provider_cls(name)
 
-    def generate(self, messages: list[dict[str, str]]):
+    @property
+    def supports_json_output(self) -> bool:
+        return self.provider.supports_json_output
+
+    def generate(self, messages: list[dict[str, str]], json_output: bool = False):
+        if json_output and self.supports_json_output:
+            return self.provider.generate(messages, json_output=True)
         return self.provider.generate(messages)
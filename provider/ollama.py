@@ -4,15 +4,19 @@ import requests
 from provider.base import BaseProvider
 
 class Ollama(BaseProvider):
+    supports_json_output = True
+
     def __init__(self, model: str):
         super().__init__(model)
     
-    def generate(self, messages: list[dict[str, str]]):
+    def generate(self, messages: list[dict[str, str]], json_output: bool = False):
         url = "http://localhost:11434/api/chat"
         payload = {
             "model": self.model,
             "messages": messages,
             "stream": False
         }
+        if json_output:
+            payload["format"] = "json"
         res = requests.post(url, json=payload)
         return res.json()
\ No newline at end of file
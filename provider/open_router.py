@@ -8,16 +8,20 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class OpenRouter(BaseProvider):
+    supports_json_output = True
+
     def __init__(self, model: str):
         super().__init__(model)
         self.api_key = os.getenv("OPENROUTER_API_KEY")
 
-    def generate(self, messages: list[dict[str, str]]):
+    def generate(self, messages: list[dict[str, str]], json_output: bool = False):
         url = "https://openrouter.ai/api/v1/chat/completions"
         payload = {
             "model": self.model,
             "messages": messages
         }
+        if json_output:
+            payload["response_format"] = {"type": "json_object"}
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -0,0 +1,347 @@
+# ./registry/model_registry.py
+
+import json
+import math
+import os
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+from constants.constants import MODEL_INFO
+from utils.logger import setup_logger
+
+logger = setup_logger("registry")
+
+DEFAULT_STATS_PATH = os.getenv(
+    "AI_COUNCIL_MODEL_STATS",
+    os.path.join(".ai_council", "model_stats.json")
+)
+
+# Number of recent calls kept per model for rolling stats
+DEFAULT_WINDOW = 100
+
+# Token counts assumed per call until a model has measurements
+DEFAULT_PROMPT_TOKENS = 2000
+DEFAULT_COMPLETION_TOKENS = 800
+
+
+def _percentile(values: Sequence[float], p: float) -> Optional[float]:
+    """Nearest-rank percentile, or None if there are no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _mean(values: Sequence[float]) -> Optional[float]:
+    return sum(values) / len(values) if values else None
+
+
+class ModelStats:
+    """Rolling performance measurements for one model.
+
+    Everything except the lifetime `calls` counter covers only the most recent
+    `window` calls, so a model recovers from an outage once it succeeds again.
+    """
+
+    __slots__ = ("latencies", "tokens_per_s", "prompt_tokens", "completion_tokens", "failures", "calls")
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.latencies = deque(maxlen=window)
+        self.tokens_per_s = deque(maxlen=window)
+        self.prompt_tokens = deque(maxlen=window)
+        self.completion_tokens = deque(maxlen=window)
+        # One entry per call: True if the call failed
+        self.failures = deque(maxlen=window)
+        self.calls = 0
+
+    def record(
+        self,
+        latency: float,
+        prompt_tokens: int = None,
+        completion_tokens: int = None,
+        error: bool = False
+    ):
+        self.calls += 1
+        self.failures.append(bool(error))
+        if error:
+            return
+        self.latencies.append(latency)
+        if prompt_tokens:
+            self.prompt_tokens.append(prompt_tokens)
+        if completion_tokens:
+            self.completion_tokens.append(completion_tokens)
+            if latency > 0:
+                self.tokens_per_s.append(completion_tokens / latency)
+
+    def latency_percentile(self, p: float) -> Optional[float]:
+        return _percentile(self.latencies, p)
+
+    @property
+    def measured(self) -> bool:
+        return bool(self.latencies)
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.failures) / len(self.failures) if self.failures else 0.0
+
+    @property
+    def mean_tokens_per_s(self) -> Optional[float]:
+        return _mean(self.tokens_per_s)
+
+    @property
+    def mean_prompt_tokens(self) -> Optional[float]:
+        return _mean(self.prompt_tokens)
+
+    @property
+    def mean_completion_tokens(self) -> Optional[float]:
+        return _mean(self.completion_tokens)
+
+    def to_dict(self) -> dict:
+        return {
+            "latencies": list(self.latencies),
+            "tokens_per_s": list(self.tokens_per_s),
+            "prompt_tokens": list(self.prompt_tokens),
+            "completion_tokens": list(self.completion_tokens),
+            "failures": list(self.failures),
+            "calls": self.calls,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, window: int = DEFAULT_WINDOW) -> "ModelStats":
+        stats = cls(window)
+        stats.latencies.extend(data.get("latencies", []))
+        stats.tokens_per_s.extend(data.get("tokens_per_s", []))
+        stats.prompt_tokens.extend(data.get("prompt_tokens", []))
+        stats.completion_tokens.extend(data.get("completion_tokens", []))
+        stats.failures.extend(data.get("failures", []))
+        stats.calls = data.get("calls", 0)
+        return stats
+
+
+class ModelProfile:
+    """Static metadata plus measured stats for one model."""
+
+    __slots__ = ("name", "provider", "context_window", "prompt_price", "completion_price", "stats")
+
+    def __init__(
+        self,
+        name: str,
+        provider: str = "unknown",
+        context_window: int = None,
+        prompt_price: float = 0.0,
+        completion_price: float = 0.0,
+        stats: ModelStats = None
+    ):
+        """
+        Args:
+            name: Model ID as passed to the provider
+            provider: Provider key ("open_router", "ollama", ...)
+            context_window: Context window in tokens, if known
+            prompt_price: USD per 1M prompt tokens
+            completion_price: USD per 1M completion tokens
+            stats: Measured stats (default: empty)
+        """
+        self.name = name
+        self.provider = provider
+        self.context_window = context_window
+        self.prompt_price = prompt_price
+        self.completion_price = completion_price
+        self.stats = stats or ModelStats()
+
+    def estimate_call_cost(self) -> float:
+        """Expected USD cost of one call, from measured token counts or defaults."""
+        prompt_tokens = self.stats.mean_prompt_tokens or DEFAULT_PROMPT_TOKENS
+        completion_tokens = self.stats.mean_completion_tokens or DEFAULT_COMPLETION_TOKENS
+        return (
+            prompt_tokens * self.prompt_price
+            + completion_tokens * self.completion_price
+        ) / 1_000_000
+
+
+class ModelRegistry:
+    """
+    Registry of known models with static metadata and rolling performance stats.
+
+    Stats are recorded by the orchestrator after every model call and
+    persisted as JSON between runs. Safe to share between threads.
+    """
+
+    def __init__(self, path: str = DEFAULT_STATS_PATH, window: int = DEFAULT_WINDOW):
+        """
+        Args:
+            path: JSON file the measured stats are loaded from and saved to
+            window: Number of recent calls kept per model
+        """
+        self.path = path
+        self.window = window
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self.profiles: Dict[str, ModelProfile] = {
+            model.value: ModelProfile(model.value, stats=ModelStats(window), **info)
+            for model, info in MODEL_INFO.items()
+        }
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load model stats from {self.path}: {e}")
+            return
+        for name, stats in data.items():
+            self.get(name).stats = ModelStats.from_dict(stats, self.window)
+
+    def save(self):
+        """Persist measured stats to `self.path`."""
+        if not self.path:
+            return
+        with self._lock:
+            data = {
+                name: profile.stats.to_dict()
+                for name, profile in self.profiles.items()
+                if profile.stats.calls
+            }
+        with self._save_lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Write then rename so a crash never leaves a truncated file
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+
+    def get(self, name: str) -> ModelProfile:
+        """Return the profile for `name`, registering an unknown model on first use."""
+        with self._lock:
+            if name not in self.profiles:
+                self.profiles[name] = ModelProfile(name, stats=ModelStats(self.window))
+            return self.profiles[name]
+
+    def record(
+        self,
+        name: str,
+        latency: float,
+        prompt_tokens: int = None,
+        completion_tokens: int = None,
+        error: bool = False
+    ):
+        """Record the outcome of one call to model `name`."""
+        profile = self.get(name)
+        with self._lock:
+            profile.stats.record(latency, prompt_tokens, completion_tokens, error)
+
+    def estimate(self, member_names: List[str], head_name: str, num_rounds: int = 3) -> dict:
+        """
+        Estimate latency and cost of a discussion before running it.
+
+        A round lasts as long as its slowest member, so the round p95 is the
+        largest member p95. Models without measurements are left out of the
+        latency estimates and listed under 'unmeasured'.
+
+        Returns:
+            dict with:
+                'p95_round_latency' (seconds, or None)
+                'p95_head_latency' (seconds, or None)
+                'p95_total_latency' (seconds, or None)
+                'cost' (USD)
+                'unmeasured' (model names without latency data)
+        """
+        members = [self.get(name) for name in member_names]
+        head = self.get(head_name)
+
+        member_p95s = [m.stats.latency_percentile(95) for m in members if m.stats.measured]
+        round_p95 = max(member_p95s) if member_p95s else None
+        head_p95 = head.stats.latency_percentile(95)
+
+        total = None
+        if round_p95 is not None or head_p95 is not None:
+            total = (round_p95 or 0.0) * num_rounds + (head_p95 or 0.0)
+
+        cost = sum(m.estimate_call_cost() for m in members) * num_rounds + head.estimate_call_cost()
+
+        unmeasured = [p.name for p in members + [head] if not p.stats.measured]
+        return {
+            "p95_round_latency": round_p95,
+            "p95_head_latency": head_p95,
+            "p95_total_latency": total,
+            "cost": cost,
+            "unmeasured": list(dict.fromkeys(unmeasured)),
+        }
+
+    def select_council(
+        self,
+        size: int,
+        max_round_p95: float = None,
+        max_cost: float = None,
+        num_rounds: int = 3,
+        max_error_rate: float = 0.5,
+        allow_unmeasured: bool = True,
+        candidates: List[str] = None
+    ) -> tuple:
+        """
+        Pick council members and a head that meet latency and cost constraints.
+
+        Members are chosen cheapest first, then fastest. The head is the
+        passing candidate with the largest context window, since it reads the
+        whole discussion.
+
+        Args:
+            size: Number of council members
+            max_round_p95: Upper bound in seconds on the estimated p95 round latency
+            max_cost: Upper bound in USD on the estimated cost of the discussion
+            num_rounds: Rounds used for the cost estimate
+            max_error_rate: Exclude models failing more often than this
+            allow_unmeasured: Whether models without latency data may be picked
+            candidates: Model names to choose from (default: all registered)
+
+        Returns:
+            (member_names, head_name)
+
+        Raises:
+            ValueError: If no council meets the constraints
+        """
+        names = candidates if candidates is not None else list(self.profiles)
+        eligible = []
+        for name in names:
+            profile = self.get(name)
+            stats = profile.stats
+            if stats.error_rate > max_error_rate:
+                continue
+            if not stats.measured:
+                if allow_unmeasured:
+                    eligible.append(profile)
+                continue
+            if max_round_p95 is not None and stats.latency_percentile(95) > max_round_p95:
+                continue
+            eligible.append(profile)
+
+        if len(eligible) < size:
+            raise ValueError(
+                f"Only {len(eligible)} models meet the constraints; {size} members requested"
+            )
+
+        def speed_key(profile):
+            p95 = profile.stats.latency_percentile(95)
+            return p95 if p95 is not None else math.inf
+
+        members = sorted(eligible, key=lambda p: (p.estimate_call_cost(), speed_key(p)))[:size]
+        member_names = [p.name for p in members]
+        member_cost = sum(p.estimate_call_cost() for p in members) * num_rounds
+
+        # The head must fit in what the members leave of the budget
+        heads = eligible
+        if max_cost is not None:
+            heads = [p for p in eligible if member_cost + p.estimate_call_cost() <= max_cost]
+            if not heads:
+                cheapest = member_cost + min(p.estimate_call_cost() for p in eligible)
+                raise ValueError(
+                    f"Cheapest council is estimated at ${cheapest:.4f}, above ${max_cost:.4f}"
+                )
+        head = max(heads, key=lambda p: (p.context_window or 0, -p.estimate_call_cost(), -speed_key(p)))
+
+        return member_names, head.name
@@ -0,0 +1,72 @@
+# ./sink/base.py
+
+from abc import ABC, abstractmethod
+
+
+def format_event(event: dict) -> str:
+    """Render an orchestrator event as the human-readable transcript text."""
+    event_type = event.get("type")
+    # Sub-councils in a hierarchical discussion tag their events
+    prefix = f"[{event['council']}] " if event.get("council") else ""
+
+    if event_type == "discussion_start":
+        return (
+            f"{'='*80}\n"
+            f"{prefix}QUERY: {event['query']}\n"
+            f"{'='*80}\n"
+            f"\nStarting discussion with up to {event['num_rounds']} rounds "
+            f"and {event['num_members']} members...\n\n"
+        )
+    if event_type == "round_start":
+        return (
+            f"\n{'='*80}\n"
+            f"{prefix}ROUND {event['round_number']}\n"
+            f"{'='*80}\n\n"
+        )
+    if event_type == "member_response":
+        body = f"⚠️  {event['error']}" if event.get("error") else event.get("content", "")
+        return (
+            f"{'─'*80}\n"
+            f"{prefix}{event['name']}:\n"
+            f"{'─'*80}\n"
+            f"{body}\n\n"
+        )
+    if event_type == "normalization":
+        if not event.get("bytes_removed"):
+            return ""
+        return (
+            f"{prefix}Round {event['round_number']}: removed {event['bytes_removed']} bytes "
+            f"(~{event['tokens_removed']} tokens) of reasoning and boilerplate\n\n"
+        )
+    if event_type == "discussion_stopped_early":
+        return f"\n{prefix}Agents ended discussion after round {event['round_number']}\n"
+    if event_type == "head_decision_start":
+        title = f"{prefix}SUB-COUNCIL REPORT" if prefix else "COUNCIL HEAD FINAL DECISION"
+        return (
+            f"\n{'='*80}\n"
+            f"🎯 {title}\n"
+            f"{'='*80}\n\n"
+        )
+    if event_type == "head_decision_complete":
+        return f"{event['content']}\n\n{'='*80}\n\n"
+    if event_type == "head_decision_error":
+        return f"❌ {prefix}Error: Council head failed to make decision: {event['error']}\n"
+    return ""
+
+
+class BaseSink(ABC):
+    """Destination for the discussion transcript produced by the orchestrator."""
+
+    @abstractmethod
+    def emit(self, event: dict):
+        raise NotImplementedError
+
+    def close(self):
+        """Flush pending output and release resources."""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,26 @@
+# ./sink/console.py
+
+import sys
+import threading
+from sink.base import BaseSink, format_event
+
+
+class ConsoleSink(BaseSink):
+    """Writes the transcript to a text stream (stdout by default).
+
+    Each event is written as a single block under a lock so that output from
+    concurrent discussions sharing the sink does not interleave mid-block.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def emit(self, event: dict):
+        text = format_event(event)
+        if not text:
+            return
+        stream = self.stream or sys.stdout
+        with self._lock:
+            stream.write(text)
+            stream.flush()
@@ -0,0 +1,83 @@
+# ./sink/file.py
+
+import json
+import queue
+import threading
+import time
+from sink.base import BaseSink, format_event
+
+_CLOSE = object()
+
+
+class AsyncFileSink(BaseSink):
+    """Buffered transcript writer that does its file I/O on a background thread.
+
+    `emit` only enqueues the event, so orchestrator threads never block on disk
+    writes. The writer thread drains the queue in batches and writes each batch
+    with a single call. The sink may be shared by many orchestrators.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 16, batch_size: int = 256):
+        """
+        Args:
+            path: File to append the transcript to
+            buffer_size: Size in bytes of the underlying file buffer
+            batch_size: Maximum number of events written per batch
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._file = open(path, "a", encoding="utf-8", buffering=buffer_size)
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._writer, name="sink-writer", daemon=True)
+        self._thread.start()
+
+    def _format(self, event: dict) -> str:
+        return format_event(event)
+
+    def emit(self, event: dict):
+        if self._closed:
+            return
+        self._queue.put(event)
+
+    def _writer(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            chunks = []
+            for event in batch:
+                if event is _CLOSE:
+                    stop = True
+                    continue
+                chunks.append(self._format(event))
+            if chunks:
+                self._file.write("".join(chunks))
+            if stop:
+                break
+
+        self._file.flush()
+        self._file.close()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._thread.join()
+
+
+class JsonlSink(AsyncFileSink):
+    """Writes one JSON object per event, with a timestamp, for machine consumption."""
+
+    def emit(self, event: dict):
+        # Stamp on emit; the writer drains in batches, so its clock is not the event's
+        super().emit({"ts": time.time(), **event})
+
+    def _format(self, event: dict) -> str:
+        return json.dumps(event, ensure_ascii=False, default=str) + "\n"
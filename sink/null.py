@@ -0,0 +1,10 @@
+# ./sink/null.py
+
+from sink.base import BaseSink
+
+
+class NullSink(BaseSink):
+    """Discards all output. Use for services where the transcript is consumed elsewhere."""
+
+    def emit(self, event: dict):
+        pass
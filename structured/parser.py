@@ -0,0 +1,161 @@
+# ./structured/parser.py
+
+import json
+import re
+from typing import Dict, Optional
+from structured.record import MemberResponse, SECTION_TITLES
+
+# Heading aliases (lowercase) -> canonical section key
+SECTION_ALIASES = {
+    "position": "position",
+    "initial position": "position",
+    "updated position": "position",
+    "current position": "position",
+    "key arguments": "key_arguments",
+    "arguments": "key_arguments",
+    "potential concerns": "concerns",
+    "concerns": "concerns",
+    "agreements": "agreements",
+    "disagreements": "disagreements",
+    "new insights": "new_insights",
+    "insights": "new_insights",
+}
+
+# Matches "**Heading:**", "**Heading**:", "Heading:" and "## Heading" at line start
+_HEADING_RE = re.compile(
+    r"^[ \t]*(?:"
+    r"#{1,6}[ \t]*(?:\*\*|__)?[ \t]*(?P<atx>[A-Za-z][A-Za-z ]{1,40}?)[ \t]*(?:\*\*|__)?[ \t]*:?[ \t]*$"
+    r"|(?:\*\*|__)?[ \t]*(?P<label>[A-Za-z][A-Za-z ]{1,40}?)[ \t]*"
+    r"(?::[ \t]*(?:\*\*|__)|(?:\*\*|__)[ \t]*:?|:)"
+    r")[ \t]*",
+    re.MULTILINE,
+)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL)
+
+
+def parse_markdown_sections(text: str) -> Dict[str, str]:
+    """
+    Split a markdown response into known sections.
+
+    Tolerates bold, heading and plain "Label:" styles. Unknown headings are
+    kept as part of the preceding section; text before the first known
+    heading is ignored.
+    """
+    if not text:
+        return {}
+
+    matches = []
+    for m in _HEADING_RE.finditer(text):
+        label = (m.group("atx") or m.group("label")).strip().lower()
+        if label in SECTION_ALIASES:
+            matches.append((m, SECTION_ALIASES[label]))
+
+    sections: Dict[str, str] = {}
+    for i, (match, key) in enumerate(matches):
+        end = matches[i + 1][0].start() if i + 1 < len(matches) else len(text)
+        body = text[match.end():end].strip()
+        if body and key not in sections:
+            sections[key] = body
+    return sections
+
+
+def _coerce_section(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return "\n".join(f"- {_coerce_section(v)}" for v in value if v)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value).strip()
+
+
+def _coerce_flag(value) -> bool:
+    """Read a JSON signal field, tolerating string booleans like "false"."""
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "yes", "1")
+    return bool(value)
+
+
+def parse_json_response(text: str) -> Optional[dict]:
+    """Extract a JSON object from a response, tolerating code fences and surrounding prose."""
+    if not text:
+        return None
+
+    candidates = [text.strip()]
+    fenced = _JSON_FENCE_RE.search(text)
+    if fenced:
+        candidates.append(fenced.group(1))
+    start, end = text.find("{"), text.rfind("}")
+    if 0 <= start < end:
+        candidates.append(text[start:end + 1])
+
+    for candidate in candidates:
+        try:
+            data = json.loads(candidate)
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            return data
+    return None
+
+
+def _section_separator(body: str) -> str:
+    return "\n" if body.startswith("- ") or "\n" in body else " "
+
+
+def to_markdown(sections: Dict[str, str]) -> str:
+    """Render parsed sections back to the markdown layout the prompts request."""
+    return "\n\n".join(
+        f"**{title}:**{_section_separator(sections[key])}{sections[key]}"
+        for key, title in SECTION_TITLES.items()
+        if sections.get(key)
+    )
+
+
+def parse_member_response(
+    name: str,
+    round_number: int,
+    text: str,
+    structured: bool = False
+) -> MemberResponse:
+    """
+    Build a MemberResponse from raw model output.
+
+    Args:
+        name: Member display name
+        round_number: Round the response belongs to
+        text: Raw response content
+        structured: The model was asked for JSON output. The markdown parser is
+            used as a fallback if the text is not a JSON object.
+    """
+    if structured:
+        data = parse_json_response(text)
+        if data is not None:
+            sections = {}
+            for raw_key, value in data.items():
+                key = SECTION_ALIASES.get(str(raw_key).replace("_", " ").strip().lower(), raw_key)
+                if key in SECTION_TITLES:
+                    coerced = _coerce_section(value)
+                    if coerced:
+                        sections[key] = coerced
+            # Signals always come from the JSON fields; the raw text contains the
+            # key names themselves. Without known sections the raw JSON is kept.
+            return MemberResponse(
+                name=name,
+                round=round_number,
+                content=to_markdown(sections) if sections else text,
+                sections=sections,
+                ready_for_decision=_coerce_flag(data.get("ready_for_decision")),
+                stop_discussion=_coerce_flag(data.get("stop_discussion")),
+            )
+
+    # Markdown replies signal by including the keyword anywhere in the text
+    lowered = text.lower()
+    return MemberResponse(
+        name=name,
+        round=round_number,
+        content=text,
+        sections=parse_markdown_sections(text),
+        ready_for_decision="ready_for_decision" in lowered,
+        stop_discussion="stop_discussion" in lowered,
+    )
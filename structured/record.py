@@ -0,0 +1,74 @@
+# ./structured/record.py
+
+from typing import Dict, Iterable
+
+# Canonical section keys, in display order, with their markdown headings
+SECTION_TITLES = {
+    "position": "Position",
+    "key_arguments": "Key Arguments",
+    "concerns": "Potential Concerns",
+    "agreements": "Agreements",
+    "disagreements": "Disagreements",
+    "new_insights": "New Insights",
+}
+
+
+class MemberResponse:
+    """Compact record of one member's contribution to a round."""
+
+    __slots__ = ("name", "round", "content", "sections", "ready_for_decision", "stop_discussion", "reasoning")
+
+    def __init__(
+        self,
+        name: str,
+        round: int,
+        content: str,
+        sections: Dict[str, str] = None,
+        ready_for_decision: bool = False,
+        stop_discussion: bool = False,
+        reasoning: str = ""
+    ):
+        """
+        Args:
+            name: Member display name
+            round: Round number the response belongs to
+            content: Full response text (markdown)
+            sections: Parsed sections keyed by SECTION_TITLES keys
+            ready_for_decision: Member signalled READY_FOR_DECISION
+            stop_discussion: Member signalled STOP_DISCUSSION
+            reasoning: Reasoning trace removed from the content; never sent to later rounds
+        """
+        self.name = name
+        self.round = round
+        self.content = content
+        self.sections = sections or {}
+        self.ready_for_decision = ready_for_decision
+        self.stop_discussion = stop_discussion
+        self.reasoning = reasoning
+
+    def render(self, sections: Iterable[str] = None) -> str:
+        """
+        Render the response for use in a later prompt.
+
+        Args:
+            sections: Section keys to include. None returns the full content.
+                Falls back to the full content if none of the sections were parsed.
+        """
+        if sections is None:
+            return self.content
+        parts = [
+            f"**{SECTION_TITLES.get(key, key)}:**\n{self.sections[key]}"
+            for key in sections
+            if self.sections.get(key)
+        ]
+        return "\n\n".join(parts) if parts else self.content
+
+    def to_dict(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self):
+        return (
+            f"MemberResponse(name={self.name!r}, round={self.round}, "
+            f"sections={list(self.sections)}, ready_for_decision={self.ready_for_decision}, "
+            f"stop_discussion={self.stop_discussion})"
+        )
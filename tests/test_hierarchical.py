@@ -0,0 +1,63 @@
+import pytest
+
+from hierarchical_orchestrator import HierarchicalOrchestrator
+from sink.null import NullSink
+
+
+class FakeModel:
+    def __init__(self, name):
+        self.name = name
+
+    def generate(self, messages):
+        return {"choices": [{"message": {"content": f"**Position:** {self.name} agrees"}}]}
+
+
+def make(count, group_size):
+    return HierarchicalOrchestrator(
+        FakeModel("head"),
+        [FakeModel(f"m{i}") for i in range(count)],
+        group_size=group_size,
+        num_rounds=1,
+        sink=NullSink(),
+    )
+
+
+@pytest.mark.parametrize(
+    "count, group_size, sizes",
+    [
+        (9, 2, [2, 2, 2, 3]),
+        (3, 2, [3]),
+        (5, 2, [2, 3]),
+        (10, 4, [4, 3, 3]),
+        (13, 4, [4, 3, 3, 3]),
+        (8, 4, [4, 4]),
+    ],
+)
+def test_split_never_produces_a_group_of_one(count, group_size, sizes):
+    groups = make(count, group_size)._split(count)
+    assert [len(g) for g in groups] == sizes
+    assert [i for g in groups for i in g] == list(range(count))
+
+
+@pytest.mark.parametrize(
+    "count, group_size, level_sizes, top_members",
+    [
+        (9, 2, [4, 2], 2),
+        (5, 2, [2], 2),
+        (3, 2, [], 3),
+        (10, 4, [3], 3),
+    ],
+)
+def test_level_structure_for_uneven_counts(count, group_size, level_sizes, top_members):
+    result = make(count, group_size).run_discussion("q")
+
+    assert [len(level) for level in result["sub_councils"]] == level_sizes
+    assert result["num_levels"] == len(level_sizes) + 1
+    for level in result["sub_councils"]:
+        for sub_council in level:
+            assert len(sub_council["discussion_history"][0]["responses"]) > 1
+
+    top = result["discussion_history"][0]["responses"]
+    assert len(top) == top_members
+    if level_sizes:
+        assert all(r.name.startswith("Sub-council") for r in top)
@@ -0,0 +1,70 @@
+import pytest
+
+from registry.model_registry import ModelRegistry
+
+FREE = "openai/gpt-oss-20b:free"
+PAID = "x-ai/grok-4.1-fast"
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return ModelRegistry(path=str(tmp_path / "stats.json"))
+
+
+def open_router(registry):
+    return [name for name, p in registry.profiles.items() if p.provider == "open_router"]
+
+
+def test_error_rate_is_windowed_and_recovers(tmp_path):
+    registry = ModelRegistry(path=str(tmp_path / "stats.json"), window=4)
+    for _ in range(4):
+        registry.record(FREE, 1.0, error=True)
+    assert registry.get(FREE).stats.error_rate == 1.0
+
+    for _ in range(4):
+        registry.record(FREE, 1.0)
+    stats = registry.get(FREE).stats
+    assert stats.error_rate == 0.0
+    assert stats.calls == 8
+
+
+def test_stats_survive_save_and_load(registry):
+    registry.record(FREE, 2.0, prompt_tokens=100, completion_tokens=50)
+    registry.record(FREE, 1.0, error=True)
+    registry.save()
+
+    stats = ModelRegistry(path=registry.path).get(FREE).stats
+    assert list(stats.latencies) == [2.0]
+    assert stats.error_rate == 0.5
+    assert stats.calls == 2
+
+
+def test_select_council_fits_head_in_remaining_budget(registry):
+    # The paid model has the largest context window but does not fit the budget
+    members, head = registry.select_council(3, max_cost=0.0005, candidates=open_router(registry))
+    assert PAID not in members
+    assert head != PAID
+
+    # With room in the budget the head is the large-context model
+    _, head = registry.select_council(3, max_cost=0.01, candidates=open_router(registry))
+    assert head == PAID
+
+
+def test_select_council_raises_when_over_budget(registry):
+    with pytest.raises(ValueError, match="Cheapest council"):
+        registry.select_council(4, max_cost=0.0005, candidates=open_router(registry))
+
+
+def test_select_council_filters_by_latency_and_errors(registry):
+    candidates = open_router(registry)
+    registry.record("google/gemma-3-27b-it:free", 30.0)
+    registry.record(FREE, 5.0)
+    registry.record("tngtech/deepseek-r1t2-chimera:free", 1.0, error=True)
+
+    members, _ = registry.select_council(
+        1, max_round_p95=20, candidates=candidates, allow_unmeasured=False
+    )
+    assert members == [FREE]
+
+    with pytest.raises(ValueError, match="meet the constraints"):
+        registry.select_council(2, max_round_p95=20, candidates=candidates, allow_unmeasured=False)
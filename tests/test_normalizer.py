@@ -0,0 +1,76 @@
+from normalize.normalizer import dedupe_quotes, normalize_output
+
+R1 = "tngtech/deepseek-r1t2-chimera:free"
+
+
+def test_strips_closed_think_block_and_keeps_trace():
+    out = normalize_output("any/model", "<think>hmm</think>\n**Position:** yes")
+    assert out.content == "**Position:** yes"
+    assert out.reasoning == "hmm"
+    assert out.bytes_removed > 0
+
+
+def test_keeps_content_starting_with_filler_word():
+    for text in (
+        "Absolutely not. Remote work hurts productivity.\n**Key Arguments:** x",
+        "Certainly the four-day week is better.\n**Key Arguments:** x",
+        "Surely this matters.\n**Key Arguments:** x",
+    ):
+        assert normalize_output("any/model", text).content == text
+
+
+def test_drops_standalone_filler_line():
+    out = normalize_output("any/model", "Sure! Here's my analysis:\n**Position:** yes")
+    assert out.content == "**Position:** yes"
+
+
+def test_unclosed_tag_in_body_is_not_a_trace():
+    text = "Use an <analysis> section and a <think> step in the report."
+    assert normalize_output("any/model", text).content == text
+    assert normalize_output(R1, text).content == text
+
+
+def test_r1_unopened_close_and_truncated_trace():
+    out = normalize_output(R1, "trace first</think>\nAnswer")
+    assert out.content == "Answer"
+    assert out.reasoning == "trace first"
+
+    out = normalize_output(R1, "<think>never finished")
+    assert out.content == ""
+    assert out.reasoning == "never finished"
+
+
+def test_unopened_close_left_alone_for_other_models():
+    text = "a</think>b"
+    assert normalize_output("any/model", text).content == text
+
+
+def test_gpt_oss_harmony_final_channel():
+    text = "<|channel|>analysis<|message|>plan<|end|><|start|>assistant<|channel|>final<|message|>Done"
+    out = normalize_output("openai/gpt-oss-20b:free", text)
+    assert out.content == "Done"
+    assert "plan" in out.reasoning
+
+
+def test_dedupe_quotes_replaces_long_quotes_of_other_members():
+    quote = "cheap energy matters more than anything else in this debate"
+    text = f"**Position:** no\n> {quote}\nok"
+    assert dedupe_quotes(text, {"B": [f"I think {quote}."]}) == "**Position:** no\n> [quoting B]\nok"
+    assert dedupe_quotes("> short", {"B": ["short"]}) == "> short"
+
+
+def test_keeps_last_line_that_only_mentions_sign_off_phrase():
+    text = (
+        "**Position:** Yes\n\n"
+        "**Confidence Level:** Medium; I hope this helps frame the next round, but costs are unknown."
+    )
+    assert normalize_output("x/grok", text).content == text
+    text = "**Position:** Yes\n**Next Steps:** Let me know if the budget changes; we would then revisit the plan and compare the options again."
+    assert normalize_output("x/grok", text).content == text
+
+
+def test_drops_standalone_sign_off_line():
+    out = normalize_output("x/grok", "**Position:** Yes\n\nLet me know if you need more detail!")
+    assert out.content == "**Position:** Yes"
+    out = normalize_output("x/grok", "**Position:** Yes\nI hope this helps.")
+    assert out.content == "**Position:** Yes"
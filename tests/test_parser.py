@@ -0,0 +1,84 @@
+import json
+
+from structured.parser import (
+    parse_json_response,
+    parse_markdown_sections,
+    parse_member_response,
+)
+
+
+def test_markdown_sections_bold_heading_and_plain_styles():
+    text = (
+        "Preamble that is ignored\n"
+        "**Initial Position:** Yes.\nMore detail.\n"
+        "**Key Arguments**:\n- a\n- b\n"
+        "## Disagreements\nNone.\n"
+        "Potential Concerns: cost"
+    )
+    sections = parse_markdown_sections(text)
+    assert sections == {
+        "position": "Yes.\nMore detail.",
+        "key_arguments": "- a\n- b",
+        "disagreements": "None.",
+        "concerns": "cost",
+    }
+
+
+def test_markdown_fallback_detects_signals_in_text():
+    record = parse_member_response("A", 2, "**Updated Position:** done. READY_FOR_DECISION")
+    assert record.ready_for_decision
+    assert not record.stop_discussion
+    assert record.sections["position"] == "done. READY_FOR_DECISION"
+
+
+def test_json_false_flags_do_not_signal():
+    text = json.dumps({
+        "position": "No",
+        "disagreements": ["x", "y"],
+        "ready_for_decision": False,
+        "stop_discussion": False,
+    })
+    record = parse_member_response("B", 1, text, structured=True)
+    assert not record.ready_for_decision
+    assert not record.stop_discussion
+    assert record.sections == {"position": "No", "disagreements": "- x\n- y"}
+
+
+def test_json_true_and_string_flags():
+    text = '{"position": "Yes", "ready_for_decision": true, "stop_discussion": "false"}'
+    record = parse_member_response("B", 1, text, structured=True)
+    assert record.ready_for_decision
+    assert not record.stop_discussion
+
+
+def test_json_in_code_fence_with_aliased_keys():
+    text = 'Here you go:\n```json\n{"updated_position": "Maybe", "new insights": "z"}\n```'
+    assert parse_json_response(text) == {"updated_position": "Maybe", "new insights": "z"}
+    record = parse_member_response("C", 2, text, structured=True)
+    assert record.sections == {"position": "Maybe", "new_insights": "z"}
+    assert record.content == "**Position:** Maybe\n\n**New Insights:** z"
+
+
+def test_structured_falls_back_to_markdown_when_json_is_invalid():
+    record = parse_member_response("D", 1, "**Position:** plain text", structured=True)
+    assert record.sections == {"position": "plain text"}
+    assert record.content == "**Position:** plain text"
+
+
+def test_render_limits_sections_and_falls_back_to_content():
+    record = parse_member_response("E", 1, "**Position:** P\n**Agreements:** A\n**Disagreements:** D")
+    assert record.render(("position", "disagreements")) == "**Position:**\nP\n\n**Disagreements:**\nD"
+    assert record.render(("new_insights",)) == record.content
+    assert record.render() == record.content
+
+
+def test_json_with_only_unknown_or_empty_keys_does_not_signal():
+    for text in (
+        '{"stance": "no", "ready_for_decision": false, "stop_discussion": false}',
+        '{"position": "", "ready_for_decision": false, "stop_discussion": false}',
+    ):
+        record = parse_member_response("F", 1, text, structured=True)
+        assert not record.ready_for_decision
+        assert not record.stop_discussion
+        assert record.sections == {}
+        assert record.content == text